@@ -1,6 +1,8 @@
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
-from fastapi import APIRouter, Query
+import orjson
+from fastapi import APIRouter, Query, Response
 
 from app.models.responses import (AgeDistributionResponse, CorrelationResponse,
                                   GenderDistributionResponse,
@@ -19,64 +21,93 @@ from app.services.statistics import (get_age_distribution, get_correlations,
 router = APIRouter(prefix="/api", tags=["api"])
 
 
+@lru_cache
+def _encoded(compute: Callable[..., Any], *args: Any) -> bytes:
+    """
+    JSON-encode the result of a static statistics call once and reuse the bytes.
+    """
+    return orjson.dumps(compute(*args))
+
+
+def _json(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+
+def _industry_list() -> dict[str, list[str]]:
+    return {"industries": get_industries()}
+
+
 @router.get("/summary", response_model=SummaryResponse)
-def summary() -> dict[str, Any]:
-    return get_summary()
+async def summary() -> Response:
+    return _json(_encoded(get_summary))
 
 
-@router.get("/employees", response_model=PaginatedDataResponse)
-def get_all(
+@router.get(
+    "/employees",
+    response_model=None,
+    responses={200: {"model": PaginatedDataResponse}},
+)
+async def get_all(
     page: int = Query(1, ge=1), limit: int = Query(10, ge=1, le=100)
-) -> PaginatedDataResponse:
-    offset = (page - 1) * limit
-    return get_paginated_data(offset=offset, limit=limit)
+) -> dict[str, Any]:
+    return get_paginated_data(offset=(page - 1) * limit, limit=limit)
 
 
 @router.get("/industries", response_model=IndustryListResponse)
-def industries():
-    return {"industries": get_industries()}
+async def industries() -> Response:
+    return _json(_encoded(_industry_list))
 
 
 @router.get("/person", response_model=list[PersonRecord])
-def person(first_name: str = Query(...), last_name: str = Query(...)) -> list[dict]:
+async def person(
+    first_name: str = Query(...), last_name: str = Query(...)
+) -> list[dict]:
     return get_individual_record(first_name, last_name)
 
 
 @router.get("/salary/stats", response_model=StatsResponse)
-def salary_stats(industry: Optional[str] = Query(None)) -> dict[str, Any]:
+async def salary_stats(industry: Optional[str] = Query(None)) -> dict[str, Any]:
     return get_salary_stats(industry)
 
 
 @router.get("/experience/stats", response_model=StatsResponse)
-def experience_stats(industry: Optional[str] = Query(None)) -> dict[str, Any]:
+async def experience_stats(industry: Optional[str] = Query(None)) -> dict[str, Any]:
     return get_experience_stats(industry)
 
 
 @router.get("/industry/distribution", response_model=IndustryDistributionResponse)
-def industry_distribution(top_n: int = Query(10, ge=1)) -> dict[str, int]:
-    return get_industry_distribution(top_n)
+async def industry_distribution(top_n: int = Query(10, ge=1)) -> Response:
+    return _json(_encoded(get_industry_distribution, top_n))
 
 
 @router.get("/gender/distribution", response_model=GenderDistributionResponse)
-def gender_distribution() -> dict[str, int]:
-    return get_gender_distribution()
+async def gender_distribution() -> Response:
+    return _json(_encoded(get_gender_distribution))
 
 
 @router.get("/age/distribution", response_model=AgeDistributionResponse)
-def age_distribution() -> dict[str, Any]:
-    return get_age_distribution()
+async def age_distribution() -> Response:
+    return _json(_encoded(get_age_distribution))
 
 
-@router.get("/top-earners", response_model=list[PersonRecord])
-def top_earners(n: int = Query(10, ge=1)) -> list[dict[str, Any]]:
+@router.get(
+    "/top-earners",
+    response_model=None,
+    responses={200: {"model": list[PersonRecord]}},
+)
+async def top_earners(n: int = Query(10, ge=1)) -> list[dict[str, Any]]:
     return get_top_earners(n)
 
 
-@router.get("/top-experienced", response_model=list[PersonRecord])
-def top_experienced(n: int = Query(10, ge=1)) -> list[dict[str, Any]]:
+@router.get(
+    "/top-experienced",
+    response_model=None,
+    responses={200: {"model": list[PersonRecord]}},
+)
+async def top_experienced(n: int = Query(10, ge=1)) -> list[dict[str, Any]]:
     return get_top_experienced(n)
 
 
 @router.get("/correlations", response_model=CorrelationResponse)
-def correlations() -> dict[str, Optional[float]]:
-    return get_correlations()
+async def correlations() -> Response:
+    return _json(_encoded(get_correlations))
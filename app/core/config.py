@@ -6,6 +6,8 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     base_dir: Path = Path(__file__).resolve().parent.parent
     data_path: Path = base_dir / "data" / "data.json"
+    parquet_path: Path = base_dir / "data" / "data.parquet"
+    cache_max_age: int = 3600
 
     class Config:
         env_file = ".env"
@@ -14,3 +16,5 @@ class Settings(BaseSettings):
 
 settings = Settings()
 DATA_PATH = settings.data_path
+PARQUET_PATH = settings.parquet_path
+CACHE_MAX_AGE = settings.cache_max_age
@@ -0,0 +1,63 @@
+from typing import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class CacheHeadersMiddleware:
+    """
+    Tag successful GET responses with a dataset ETag and ``Cache-Control``.
+
+    A request whose ``If-None-Match`` matches the ETag gets a bodyless 304, but
+    only once the route has produced a 200, so errors and unknown paths are
+    never reported as "not modified". Implemented as plain ASGI to keep the
+    per-request overhead to a header rewrite.
+    """
+
+    def __init__(
+        self, app: ASGIApp, etag: Callable[[], str], max_age: int, prefix: str = "/api"
+    ) -> None:
+        self.app = app
+        self.etag = etag
+        self.cache_control = f"public, max-age={max_age}"
+        self.prefix = prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not scope["path"].startswith(self.prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        etag = self.etag()
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        matches = etag in candidates or "*" in candidates
+        not_modified = False
+
+        async def send_with_cache_headers(message: Message) -> None:
+            nonlocal not_modified
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                    return
+                headers = MutableHeaders(scope=message)
+                headers["etag"] = etag
+                headers["cache-control"] = self.cache_control
+                if matches:
+                    not_modified = True
+                    message["status"] = 304
+                    del headers["content-length"]
+                    del headers["content-type"]
+                await send(message)
+            elif not_modified:
+                if not message.get("more_body", False):
+                    await send({"type": "http.response.body", "body": b""})
+            else:
+                await send(message)
+
+        await self.app(scope, receive, send_with_cache_headers)
@@ -1,6 +1,19 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from app.api import endpoints
+from app.core.config import CACHE_MAX_AGE
+from app.core.middleware import CacheHeadersMiddleware
+from app.core.responses import ORJSONResponse
+from app.services.statistics import dataset_etag, warm_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_cache()
+    yield
+
 
 app = FastAPI(
     title="Employee Statistics API",
@@ -9,6 +22,10 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+
+app.add_middleware(CacheHeadersMiddleware, etag=dataset_etag, max_age=CACHE_MAX_AGE)
 app.include_router(endpoints.router)
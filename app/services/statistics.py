@@ -1,37 +1,60 @@
-import datetime
+import hashlib
 import json
 from functools import lru_cache
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Iterable, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from fastapi import HTTPException
 
-from app.core.config import DATA_PATH
-from app.models.responses import (PaginatedDataResponse, PaginationMeta,
-                                  PersonRecord)
+from app.core.config import DATA_PATH, PARQUET_PATH
+from app.models.responses import PersonRecord
 
+RECORD_COLUMNS = [
+    "first_name",
+    "last_name",
+    "salary",
+    "years_of_experience",
+    "industry",
+]
 
-def calculate_age(born: datetime.datetime) -> int:
+
+@lru_cache
+def reference_date() -> pd.Timestamp:
+    """
+    The date ages are computed against, fixed for the lifetime of the process.
+
+    Returns:
+        pd.Timestamp: Today's date at midnight when first called.
     """
-    Calculate age from a given birthdate.
+    return pd.Timestamp.today().normalize()
+
+
+def calculate_age(born: pd.Series, today: pd.Timestamp) -> pd.Series:
+    """
+    Calculate ages from a series of birthdates in a single vectorized pass.
 
     Args:
-        born (datetime.datetime): The person's date of birth.
+        born (pd.Series): Dates of birth (datetime64, may contain NaT).
+        today (pd.Timestamp): Date to measure the ages at.
 
     Returns:
-        int: Age in years.
+        pd.Series: Age in years, NaN where the birthdate is missing.
     """
-    today = datetime.datetime.today()
-    return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+    before_birthday = (born.dt.month > today.month) | (
+        (born.dt.month == today.month) & (born.dt.day > today.day)
+    )
+    return today.year - born.dt.year - before_birthday
 
 
-@lru_cache
-def load_dataframe() -> pd.DataFrame:
+def read_json_dataset() -> pd.DataFrame:
     """
-    Load and preprocess the dataset from JSON.
+    Read the raw JSON dataset and coerce its columns to proper dtypes.
 
     Returns:
-        pd.DataFrame: Cleaned and augmented DataFrame with additional columns like age.
+        pd.DataFrame: Typed DataFrame with numeric and datetime columns parsed.
     """
     with open(DATA_PATH) as f:
         data = json.load(f)
@@ -43,52 +66,239 @@ def load_dataframe() -> pd.DataFrame:
     df["date_of_birth"] = pd.to_datetime(
         df["date_of_birth"], format="%d/%m/%Y", errors="coerce"
     )
-    df["age"] = df["date_of_birth"].apply(
-        lambda x: calculate_age(x) if pd.notnull(x) else None
-    )
     return df
 
 
-def get_paginated_data(offset: int = 0, limit: int = 10) -> PaginatedDataResponse:
+def dataset_path() -> Path:
+    """
+    Pick the file the dataset is loaded from.
+
+    The Parquet copy (see ``tools/convert_to_parquet.py``) is used only when it
+    is at least as new as the JSON source, so edits to ``data.json`` are never
+    shadowed by a stale conversion.
+
+    Returns:
+        Path: Path of the Parquet or JSON data file.
+    """
+    if PARQUET_PATH.exists() and (
+        not DATA_PATH.exists()
+        or PARQUET_PATH.stat().st_mtime >= DATA_PATH.stat().st_mtime
+    ):
+        return PARQUET_PATH
+    return DATA_PATH
+
+
+@lru_cache
+def load_dataframe() -> pd.DataFrame:
+    """
+    Load and preprocess the dataset, preferring an up-to-date Parquet copy.
+
+    Returns:
+        pd.DataFrame: Cleaned and augmented DataFrame with additional columns like age.
+    """
+    if dataset_path() == PARQUET_PATH:
+        df = pd.read_parquet(PARQUET_PATH, engine="pyarrow")
+    else:
+        df = read_json_dataset()
+    df["industry"] = df["industry"].astype("category")
+    df["gender"] = df["gender"].astype("category")
+    df["age"] = calculate_age(df["date_of_birth"], reference_date())
+    return df
+
+
+@lru_cache
+def dataset_etag() -> str:
+    """
+    Strong ETag identifying the dataset served by this process.
+
+    Ages depend on the reference date, so it is hashed along with the data
+    file; a restart on a later day yields a new tag.
+
+    Returns:
+        str: Quoted MD5 digest of the loaded data file and reference date.
+    """
+    md5 = hashlib.md5(dataset_path().read_bytes(), usedforsecurity=False)
+    md5.update(reference_date().date().isoformat().encode())
+    return f'"{md5.hexdigest()}"'
+
+
+@lru_cache
+def _name_index() -> dict[tuple[str, str], np.ndarray]:
+    """
+    Map lowercased (first_name, last_name) pairs to their row positions.
+
+    Returns:
+        dict[tuple[str, str], np.ndarray]: Row positions for each name pair.
+    """
+    df = load_dataframe()
+    return df.groupby(
+        [df["first_name"].str.lower(), df["last_name"].str.lower()]
+    ).indices
+
+
+@lru_cache
+def _descending_order(column: str) -> np.ndarray:
+    """
+    Row positions sorted by a numeric column, largest first and NaN last.
+
+    Ties keep their original row order.
+
+    Args:
+        column (str): Name of the numeric column to sort by.
+
+    Returns:
+        np.ndarray: Row positions in descending order of the column.
+    """
+    return np.argsort(-_numeric_arrays()[column], kind="stable")
+
+
+@lru_cache
+def _industry_rows() -> dict[str, np.ndarray]:
+    """
+    Row positions of every industry, computed from the categorical codes.
+
+    Returns:
+        dict[str, np.ndarray]: Industry name to row positions mapping.
+    """
+    industry = load_dataframe()["industry"]
+    codes = industry.cat.codes.to_numpy()
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes + 1, minlength=len(industry.cat.categories) + 1)
+    groups = np.split(order, np.cumsum(counts)[:-1])
+    # The first group holds the rows with a missing industry (code -1).
+    return dict(zip(industry.cat.categories, groups[1:]))
+
+
+@lru_cache
+def _stats_by_industry(column: str) -> dict[str, dict[str, float]]:
+    """
+    Descriptive statistics of a numeric column for every industry.
+
+    Args:
+        column (str): Name of the numeric column to describe.
+
+    Returns:
+        dict[str, dict[str, float]]: Industry name to statistics mapping.
+    """
+    values = _numeric_arrays()[column]
+    return {
+        industry: _describe(values[rows]) for industry, rows in _industry_rows().items()
+    }
+
+
+@lru_cache
+def _all_records() -> list[dict[str, Any]]:
+    """
+    Every row as a plain record dict, with missing values mapped to None.
+
+    The rows are converted through Arrow, which treats NaN as null and builds
+    the dicts in C instead of boxing each cell through pandas.
+
+    Returns:
+        list[dict[str, Any]]: All records in dataset order.
+    """
+    df = load_dataframe()
+    table = pa.Table.from_pandas(df[RECORD_COLUMNS], preserve_index=False)
+    return table.to_pylist()
+
+
+def _rows_to_records(rows: Iterable[int]) -> list[dict[str, Any]]:
+    """
+    Look up cached record dicts by row position, skipping pandas indexing.
+
+    Args:
+        rows (Iterable[int]): Row positions to fetch.
+
+    Returns:
+        list[dict[str, Any]]: Records in the order of ``rows``.
+    """
+    records = _all_records()
+    return [records[row] for row in rows]
+
+
+@lru_cache
+def _numeric_arrays() -> dict[str, np.ndarray]:
+    """
+    Contiguous float arrays of the numeric columns used by the stats endpoints.
+
+    Returns:
+        dict[str, np.ndarray]: Column name to float64 array mapping.
+    """
+    df = load_dataframe()
+    return {
+        column: np.ascontiguousarray(df[column].to_numpy(dtype=np.float64))
+        for column in ("salary", "years_of_experience", "age")
+    }
+
+
+def _describe(values: np.ndarray) -> dict[str, float]:
+    """
+    Descriptive statistics matching ``pd.Series.describe().dropna()``.
+
+    Args:
+        values (np.ndarray): Float array, may contain NaN.
+
+    Returns:
+        dict[str, float]: count, mean, std, min, quartiles and max.
+    """
+    values = values[~np.isnan(values)]
+    count = len(values)
+    if count == 0:
+        return {"count": 0.0}
+    p25, p50, p75 = np.percentile(values, [25, 50, 75])
+    stats = {
+        "count": float(count),
+        "mean": float(values.mean()),
+        "std": float(values.std(ddof=1)) if count > 1 else None,
+        "min": float(values.min()),
+        "25%": float(p25),
+        "50%": float(p50),
+        "75%": float(p75),
+        "max": float(values.max()),
+    }
+    return {key: value for key, value in stats.items() if value is not None}
+
+
+def get_paginated_data(offset: int = 0, limit: int = 10) -> dict[str, Any]:
     """
     Return a paginated view of the dataset.
 
+    The payload is built as plain dicts shaped like ``PaginatedDataResponse``;
+    the records are already clean, so no model validation is needed.
+
     Args:
         offset (int): Number of records to skip.
         limit (int): Maximum number of records to return.
 
     Returns:
-        list[dict[str, Any]]: List of records.
+        dict[str, Any]: Page of records and pagination metadata.
     """
-    df = load_dataframe()
-    total_records = len(df)
+    records = _all_records()
+    total_records = len(records)
 
     if offset >= total_records:
         raise HTTPException(status_code=404, detail="Page out of range")
 
-    page_data = (
-        df.iloc[offset : offset + limit]
-        .replace({float("nan"): None})
-        .to_dict(orient="records")
-    )
+    page_data = records[offset : offset + limit]
 
     current_page = (offset // limit) + 1
     total_pages = (total_records + limit - 1) // limit
     next_page = current_page + 1 if current_page < total_pages else None
     prev_page = current_page - 1 if current_page > 1 else None
 
-    return PaginatedDataResponse(
-        data=page_data,
-        pagination=PaginationMeta(
-            total_records=total_records,
-            current_page=current_page,
-            total_pages=total_pages,
-            next_page=next_page,
-            prev_page=prev_page,
-        ),
-    )
+    return {
+        "data": page_data,
+        "pagination": {
+            "total_records": total_records,
+            "current_page": current_page,
+            "total_pages": total_pages,
+            "next_page": next_page,
+            "prev_page": prev_page,
+        },
+    }
 
 
+@lru_cache
 def get_summary() -> dict[str, Any]:
     """
     Generate a summary of the dataset.
@@ -103,6 +313,7 @@ def get_summary() -> dict[str, Any]:
     }
 
 
+@lru_cache
 def get_industries() -> list[str]:
     """
     Return a list of unique industries found in the dataset.
@@ -125,16 +336,11 @@ def get_individual_record(first_name: str, last_name: str) -> list[dict[str, Any
     Returns:
         list[dict[str, Any]]: Matching records.
     """
-    df = load_dataframe()
-    match = df[
-        (df["first_name"].str.lower() == first_name.lower())
-        & (df["last_name"].str.lower() == last_name.lower())
-    ]
-    return match[
-        ["first_name", "last_name", "salary", "years_of_experience", "industry"]
-    ].to_dict(orient="records")
+    rows = _name_index().get((first_name.lower(), last_name.lower()), [])
+    return _rows_to_records(rows)
 
 
+@lru_cache
 def get_salary_stats(industry: Optional[str] = None) -> dict[str, Any]:
     """
     Compute salary statistics across the dataset or for a specific industry.
@@ -145,11 +351,12 @@ def get_salary_stats(industry: Optional[str] = None) -> dict[str, Any]:
     Returns:
         dict[str, Any]: Salary descriptive statistics.
     """
-    df = load_dataframe()
-    subset = df[df["industry"] == industry] if industry else df
-    return subset["salary"].describe().dropna().to_dict()
+    if industry:
+        return _stats_by_industry("salary").get(industry, {"count": 0.0})
+    return _describe(_numeric_arrays()["salary"])
 
 
+@lru_cache
 def get_experience_stats(industry: Optional[str] = None) -> dict[str, Any]:
     """
     Compute experience statistics across the dataset or for a specific industry.
@@ -160,11 +367,12 @@ def get_experience_stats(industry: Optional[str] = None) -> dict[str, Any]:
     Returns:
         dict[str, Any]: Experience descriptive statistics.
     """
-    df = load_dataframe()
-    subset = df[df["industry"] == industry] if industry else df
-    return subset["years_of_experience"].describe().dropna().to_dict()
+    if industry:
+        return _stats_by_industry("years_of_experience").get(industry, {"count": 0.0})
+    return _describe(_numeric_arrays()["years_of_experience"])
 
 
+@lru_cache
 def get_industry_distribution(top_n: int) -> dict[str, int]:
     """
     Get the most common industries by frequency.
@@ -175,10 +383,17 @@ def get_industry_distribution(top_n: int) -> dict[str, int]:
     Returns:
         dict[str, int]: Industry name to count mapping.
     """
-    df = load_dataframe()
-    return df["industry"].value_counts().head(top_n).to_dict()
+    industry = load_dataframe()["industry"]
+    codes = industry.cat.codes.to_numpy()
+    # Order by count, breaking ties by first appearance in the data rather
+    # than by the alphabetical category order a categorical value_counts uses.
+    seen = pd.unique(codes[codes >= 0])
+    counts = np.bincount(codes[codes >= 0], minlength=len(industry.cat.categories))
+    top = seen[np.argsort(-counts[seen], kind="stable")[:top_n]]
+    return {industry.cat.categories[code]: int(counts[code]) for code in top}
 
 
+@lru_cache
 def get_gender_distribution() -> dict[str, int]:
     """
     Get the distribution of gender across the dataset.
@@ -186,12 +401,13 @@ def get_gender_distribution() -> dict[str, int]:
     Returns:
         dict[str, int]: Gender to count mapping.
     """
-    df = load_dataframe()
-    return (
-        df["gender"].fillna("Unknown").value_counts().to_dict()
-    )
+    # Count on plain values: a categorical value_counts would report empty
+    # categories and order ties alphabetically instead of by first appearance.
+    gender = load_dataframe()["gender"].astype(object)
+    return gender.fillna("Unknown").value_counts().to_dict()
 
 
+@lru_cache
 def get_age_distribution() -> dict[str, Any]:
     """
     Compute descriptive statistics for age.
@@ -199,10 +415,10 @@ def get_age_distribution() -> dict[str, Any]:
     Returns:
         dict[str, Any]: Age statistics including mean, std, and quartiles.
     """
-    df = load_dataframe()
-    return df["age"].describe().dropna().to_dict()
+    return _describe(_numeric_arrays()["age"])
 
 
+@lru_cache
 def get_top_earners(n: int) -> list[PersonRecord]:
     """
     Retrieve the top n earners by salary.
@@ -213,13 +429,10 @@ def get_top_earners(n: int) -> list[PersonRecord]:
     Returns:
         list[PersonRecord]: List of top earners with relevant details.
     """
-    df = load_dataframe()
-    top = df.sort_values(by="salary", ascending=False).head(n)
-    return top[["first_name", "last_name", "salary", "industry"]].to_dict(
-        orient="records"
-    )
+    return _rows_to_records(_descending_order("salary")[:n])
 
 
+@lru_cache
 def get_top_experienced(n: int) -> list[dict[str, Any]]:
     """
     Retrieve the top n individuals with the most experience.
@@ -230,13 +443,29 @@ def get_top_experienced(n: int) -> list[dict[str, Any]]:
     Returns:
         list[dict[str, Any]]: List of most experienced individuals.
     """
-    df = load_dataframe()
-    top = df.sort_values(by="years_of_experience", ascending=False).head(n)
-    return top[["first_name", "last_name", "years_of_experience", "industry"]].to_dict(
-        orient="records"
-    )
+    return _rows_to_records(_descending_order("years_of_experience")[:n])
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> Optional[float]:
+    """
+    Pearson correlation of two arrays over the rows where both are present.
+
+    Args:
+        x (np.ndarray): First numeric array.
+        y (np.ndarray): Second numeric array.
+
+    Returns:
+        Optional[float]: Coefficient rounded to 4 decimals, or None if undefined.
+    """
+    mask = ~np.isnan(x) & ~np.isnan(y)
+    if mask.sum() < 2:
+        return None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.corrcoef(x[mask], y[mask])[0, 1]
+    return round(float(corr), 4) if np.isfinite(corr) else None
 
 
+@lru_cache
 def get_correlations() -> dict[str, Optional[float]]:
     """
     Compute correlation values between selected numeric columns.
@@ -244,10 +473,35 @@ def get_correlations() -> dict[str, Optional[float]]:
     Returns:
         dict[str, Optional[float]]: Correlation coefficients for salary vs experience, and experience vs age.
     """
-    df = load_dataframe()
-    corr1 = df[["salary", "years_of_experience"]].corr().iloc[0, 1]
-    corr2 = df[["years_of_experience", "age"]].corr().iloc[0, 1]
+    arrays = _numeric_arrays()
+    salary = arrays["salary"]
+    experience = arrays["years_of_experience"]
     return {
-        "salary_vs_experience": round(corr1, 4) if pd.notnull(corr1) else None,
-        "experience_vs_age": round(corr2, 4) if pd.notnull(corr2) else None,
+        "salary_vs_experience": _pearson(salary, experience),
+        "experience_vs_age": _pearson(experience, arrays["age"]),
     }
+
+
+def warm_cache() -> None:
+    """
+    Precompute every cached aggregate so no request pays the first-call cost.
+    """
+    load_dataframe()
+    dataset_etag()
+    _name_index()
+    _all_records()
+    _numeric_arrays()
+    _descending_order("salary")
+    _descending_order("years_of_experience")
+    _stats_by_industry("salary")
+    _stats_by_industry("years_of_experience")
+    get_summary()
+    get_industries()
+    get_salary_stats()
+    get_experience_stats()
+    get_industry_distribution(10)
+    get_gender_distribution()
+    get_age_distribution()
+    get_top_earners(10)
+    get_top_experienced(10)
+    get_correlations()
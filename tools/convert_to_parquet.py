@@ -0,0 +1,19 @@
+"""
+Convert the JSON dataset to Parquet so the API can skip parsing and dtype
+coercion at startup.
+
+Usage (from the repository root):
+    python -m tools.convert_to_parquet
+"""
+from app.core.config import PARQUET_PATH
+from app.services.statistics import read_json_dataset
+
+
+def main() -> None:
+    df = read_json_dataset()
+    df.to_parquet(PARQUET_PATH, engine="pyarrow", index=False)
+    print(f"Wrote {len(df)} records to {PARQUET_PATH}")
+
+
+if __name__ == "__main__":
+    main()